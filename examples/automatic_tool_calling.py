@@ -8,107 +8,183 @@ appropriate Memory Bank tools to fulfill user requests.
 """
 
 import asyncio
-import json
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Dict, Optional
 
 from google import genai
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import ListToolsResult
+from pydantic_core import from_json
+
+SERVER_PATH = str(Path(__file__).parent.parent / "memory_bank_server.py")
+
+# Tools Gemini needs for each kind of turn. Every declared tool schema is sent
+# with every request, so each turn only exposes the tools it actually uses.
+STORE_TOOLS = frozenset({"create_memory", "create_memories_batch"})
+RETRIEVE_TOOLS = frozenset({"retrieve_memories"})
+
+
+class TrimmedToolsSession(ClientSession):
+    """
+    MCP session that lists tools once and exposes a per-turn subset.
+
+    Gemini calls `list_tools()` on every `generate_content` request and sends
+    every returned schema to the model. This session caches the server's
+    tool list and only returns the tools named in `allowed_tools`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.allowed_tools: Optional[frozenset] = None
+        self._all_tools: Optional[ListToolsResult] = None
+        self._trimmed_tools: Dict[frozenset, ListToolsResult] = {}
+
+    async def list_tools(self, cursor: Optional[str] = None) -> ListToolsResult:
+        if self._all_tools is None:
+            self._all_tools = await super().list_tools(cursor)
+        if self.allowed_tools is None:
+            return self._all_tools
+
+        if self.allowed_tools not in self._trimmed_tools:
+            self._trimmed_tools[self.allowed_tools] = self._all_tools.model_copy(
+                update={
+                    "tools": [
+                        tool
+                        for tool in self._all_tools.tools
+                        if tool.name in self.allowed_tools
+                    ]
+                }
+            )
+        return self._trimmed_tools[self.allowed_tools]
+
+
+@asynccontextmanager
+async def memory_bank_session(
+    project_id: str, location: str, server_url: Optional[str] = None
+):
+    """
+    Open a single MCP session to the Memory Bank server.
+
+    The connection and MCP handshake happen once; every Gemini turn made
+    inside the block reuses the same session. With `server_url` the session
+    connects over streamable HTTP to a server started with
+    `--transport streamable-http`; otherwise the server is spawned over stdio.
+    """
+    if server_url:
+        async with streamablehttp_client(server_url) as (read, write, _):
+            async with TrimmedToolsSession(read, write) as session:
+                await session.initialize()
+                yield session
+        return
 
-
-async def demo_automatic_tool_calling():
-    """Demonstrate Gemini's automatic tool calling with Memory Bank."""
-
-    # Configuration
-    PROJECT_ID = os.environ.get("GOOGLE_CLOUD_PROJECT", "your-project-id")
-    LOCATION = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
-    SERVER_PATH = str(Path(__file__).parent.parent / "memory_bank_server.py")
-
-    # Create Gemini client
-    client = genai.Client(vertexai=True, project=PROJECT_ID, location=LOCATION)
-
-    # Create MCP server parameters
     server_params = StdioServerParameters(
         command=sys.executable,
         args=[SERVER_PATH],
-        env={"GOOGLE_CLOUD_PROJECT": PROJECT_ID, "GOOGLE_CLOUD_LOCATION": LOCATION},
+        env={
+            **os.environ,
+            "GOOGLE_CLOUD_PROJECT": project_id,
+            "GOOGLE_CLOUD_LOCATION": location,
+        },
     )
 
     async with stdio_client(server_params) as (read, write):
-        async with ClientSession(read, write) as session:
-            # Initialize MCP session
+        async with TrimmedToolsSession(read, write) as session:
             await session.initialize()
+            yield session
 
-            print("Initializing Memory Bank...\n")
-
-            # Initialize Memory Bank first
-            init_result = await session.call_tool(
-                "initialize_memory_bank",
-                {
-                    "project_id": PROJECT_ID,
-                    "location": LOCATION,
-                    "memory_topics": ["USER_PREFERENCES", "USER_PERSONAL_INFO"],
-                },
-            )
-
-            if hasattr(init_result, "content") and init_result.content:
-                init_data = json.loads(init_result.content[0].text)
-                engine_name = init_data.get("agent_engine_name")
-                print(f"Memory Bank initialized with engine:\n   {engine_name}\n")
-
-            # Turn 1: Store memories
-            print("=" * 100)
-            print("TURN 1: Storing memories")
-            print("=" * 100)
-
-            store_prompt = """
-            Please create two memories for me:
-            1. I (user_id: "gemini_demo_user") prefer dark mode in all applications
-            2. I (user_id: "gemini_demo_user") love Python programming
-
-            Confirm when the memories are stored.
-            """
-
-            print("Sending request to Gemini to store memories...\n")
-
-            response1 = await client.aio.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=store_prompt,
-                config=genai.types.GenerateContentConfig(
-                    temperature=0,
-                    tools=[session],
-                ),
-            )
-
-            print("Gemini Response:")
-            print(response1.text)
-            print("\n")
 
-            # Turn 2: Retrieve memories
-            print("=" * 100)
-            print("TURN 2: Retrieving memories")
-            print("=" * 100)
-
-            retrieve_prompt = """
-            Now retrieve all memories for user_id: "gemini_demo_user" and show me what you found.
-            """
+async def demo_automatic_tool_calling():
+    """Demonstrate Gemini's automatic tool calling with Memory Bank."""
 
-            print("Sending request to Gemini to retrieve memories...\n")
+    # Configuration
+    PROJECT_ID = os.environ.get("GOOGLE_CLOUD_PROJECT", "your-project-id")
+    LOCATION = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
+    # Optional: URL of a server started with --transport streamable-http
+    SERVER_URL = os.environ.get("MEMORY_BANK_SERVER_URL")
 
-            response2 = await client.aio.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=retrieve_prompt,
-                config=genai.types.GenerateContentConfig(
-                    temperature=0,
-                    tools=[session],
-                ),
-            )
+    # Create Gemini client
+    client = genai.Client(vertexai=True, project=PROJECT_ID, location=LOCATION)
 
-            print("Gemini Response:")
-            print(response2.text)
-            print("=" * 100)
+    async with memory_bank_session(PROJECT_ID, LOCATION, SERVER_URL) as session:
+        print("Initializing Memory Bank...\n")
+
+        # Initialize Memory Bank first
+        init_result = await session.call_tool(
+            "initialize_memory_bank",
+            {
+                "project_id": PROJECT_ID,
+                "location": LOCATION,
+                "memory_topics": ["USER_PREFERENCES", "USER_PERSONAL_INFO"],
+            },
+        )
+
+        init_data = init_result.structuredContent
+        if init_data is None and init_result.content:
+            init_data = from_json(init_result.content[0].text)
+        if init_data:
+            engine_name = init_data.get("agent_engine_name")
+            print(f"Memory Bank initialized with engine:\n   {engine_name}\n")
+
+        # Turn 1: Store memories
+        print("=" * 100)
+        print("TURN 1: Storing memories")
+        print("=" * 100)
+
+        store_prompt = """
+        Please create two memories for me in a single batch call:
+        1. I (user_id: "gemini_demo_user") prefer dark mode in all applications
+        2. I (user_id: "gemini_demo_user") love Python programming
+
+        Confirm when the memories are stored.
+        """
+
+        print("Sending request to Gemini to store memories...\n")
+
+        session.allowed_tools = STORE_TOOLS
+
+        response1 = await client.aio.models.generate_content(
+            model="gemini-2.5-flash",
+            contents=store_prompt,
+            config=genai.types.GenerateContentConfig(
+                temperature=0,
+                tools=[session],
+            ),
+        )
+
+        print("Gemini Response:")
+        print(response1.text)
+        print("\n")
+
+        # Turn 2: Retrieve memories
+        print("=" * 100)
+        print("TURN 2: Retrieving memories")
+        print("=" * 100)
+
+        retrieve_prompt = """
+        Now retrieve all memories for user_id: "gemini_demo_user" and show me what you found.
+        """
+
+        print("Sending request to Gemini to retrieve memories...\n")
+
+        session.allowed_tools = RETRIEVE_TOOLS
+
+        response2 = await client.aio.models.generate_content(
+            model="gemini-2.5-flash",
+            contents=retrieve_prompt,
+            config=genai.types.GenerateContentConfig(
+                temperature=0,
+                tools=[session],
+            ),
+        )
+
+        print("Gemini Response:")
+        print(response2.text)
+        print("=" * 100)
 
 
 if __name__ == "__main__":
@@ -10,67 +10,243 @@ import asyncio
 import json
 import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from pydantic_core import from_json
+
+
+def preview(data: Any, limit: int) -> str:
+    """
+    Render the start of `data` as indented JSON.
+
+    Encoding is incremental and stops after `limit` characters, so large
+    tool results are never serialized in full just to be truncated.
+    """
+    chunks = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(chunks)[:limit]
 
 
 class MemoryBankMCPClient:
     """A client for interacting with the Memory Bank MCP server."""
 
-    def __init__(self, server_path: str, project_id: str, location: str):
-        """Initialize the Memory Bank MCP client."""
+    # Tools that change stored memories and so invalidate cached retrievals
+    WRITE_TOOLS = frozenset(
+        {"generate_memories", "create_memory", "create_memories_batch", "delete_memory"}
+    )
+
+    def __init__(
+        self,
+        server_path: str,
+        project_id: str,
+        location: str,
+        cache_size: int = 256,
+        server_url: Optional[str] = None,
+    ):
+        """
+        Initialize the Memory Bank MCP client.
+
+        By default the client spawns the server as a subprocess over stdio.
+        Pass `server_url` (e.g. "http://127.0.0.1:8000/mcp") to connect to a
+        long-running server started with `--transport streamable-http`.
+        """
         self.project_id = project_id
+        self.server_url = server_url
         self.location = location
+        # The server inherits our environment (credentials, PATH, HOME) so the
+        # long-lived subprocess discovers Application Default Credentials once
+        self._env = {
+            **os.environ,
+            "GOOGLE_CLOUD_PROJECT": self.project_id,
+            "GOOGLE_CLOUD_LOCATION": self.location
+        }
         self.server_params = StdioServerParameters(
             command=sys.executable,
             args=[server_path],
-            env={
-                "GOOGLE_CLOUD_PROJECT": self.project_id,
-                "GOOGLE_CLOUD_LOCATION": self.location
-            }
+            env=self._env
         )
         self.session = None
         self.initialized = False
-        self.stdio_cm = None
+        self.transport_cm = None
         self.session_cm = None
+        self._tools_cache = None
+        self.cache_size = cache_size
+        self._retrieval_cache = OrderedDict()
+        self._prefetch_tasks = {}
+        self._cache_generation = 0
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
 
     async def connect(self):
         """Establish connection to the MCP server."""
-        self.stdio_cm = stdio_client(self.server_params)
-        self.read, self.write = await self.stdio_cm.__aenter__()
+        # Reuse the live session; spawning a new server process and redoing
+        # the MCP handshake is the dominant per-call cost over stdio.
+        if self.session is not None:
+            return self
+
+        # Each context manager is recorded only once entered, so disconnect()
+        # can clean up after a failure at any step
+        try:
+            if self.server_url:
+                transport_cm = streamablehttp_client(self.server_url)
+                self.read, self.write, _ = await transport_cm.__aenter__()
+            else:
+                transport_cm = stdio_client(self.server_params)
+                self.read, self.write = await transport_cm.__aenter__()
+            self.transport_cm = transport_cm
+
+            session_cm = ClientSession(self.read, self.write)
+            session = await session_cm.__aenter__()
+            self.session_cm = session_cm
 
-        self.session_cm = ClientSession(self.read, self.write)
-        self.session = await self.session_cm.__aenter__()
+            await session.initialize()
+            self._tools_cache = (await session.list_tools()).tools
+        except BaseException:
+            await self.disconnect()
+            raise
 
-        await self.session.initialize()
+        # Only a session that completed the handshake is reused
+        self.session = session
         print("Connected to Memory Bank MCP server")
 
         return self
 
     async def disconnect(self):
         """Close the connection to the MCP server."""
+        for task in self._prefetch_tasks.values():
+            task.cancel()
         if self.session_cm:
             await self.session_cm.__aexit__(None, None, None)
-        if self.stdio_cm:
-            await self.stdio_cm.__aexit__(None, None, None)
+        if self.transport_cm:
+            await self.transport_cm.__aexit__(None, None, None)
+        self.session = None
+        self.session_cm = None
+        self.transport_cm = None
+        self._tools_cache = None
+        self.clear_cache()
         print("\nDisconnected from Memory Bank MCP server")
 
+    async def list_tools(self) -> List[Any]:
+        """List the tools exposed by the MCP server (cached per connection)."""
+        if not self.session:
+            raise RuntimeError("Not connected to MCP server")
+
+        return self._tools_cache
+
     async def call_tool(self, tool_name: str, arguments: dict) -> Any:
         """Call a tool on the MCP server."""
         if not self.session:
             raise RuntimeError("Not connected to MCP server")
 
-        result = await self.session.call_tool(tool_name, arguments)
+        if tool_name in self.WRITE_TOOLS:
+            self.clear_cache()
+            try:
+                result = await self.session.call_tool(tool_name, arguments)
+            finally:
+                # Retrievals that started while the write was in flight may
+                # have read the old state; don't let them be cached
+                self.clear_cache()
+        else:
+            result = await self.session.call_tool(tool_name, arguments)
 
-        if hasattr(result, 'content') and result.content:
-            if result.content[0].type == 'text':
-                return json.loads(result.content[0].text)
+        # Structured results arrive already parsed; skip the JSON text copy
+        if result.structuredContent is not None:
+            return result.structuredContent
+
+        if result.content and result.content[0].type == 'text':
+            return from_json(result.content[0].text)
 
         return result
 
+    async def call_tools_parallel(self, calls: List[Tuple[str, dict]]) -> List[Any]:
+        """Call independent tools concurrently over the same session."""
+        return await asyncio.gather(
+            *(self.call_tool(tool_name, arguments) for tool_name, arguments in calls)
+        )
+
+    async def retrieve_memories(
+        self, scope: Dict[str, str], search_query: Optional[str] = None, top_k: int = 5
+    ) -> Any:
+        """
+        Retrieve memories through a local LRU cache.
+
+        Repeated retrievals for the same scope and query are served locally.
+        The first search for a scope also prefetches all of that scope's
+        memories in the background, so a later unfiltered retrieval is
+        usually already in flight or complete. Any write tool called through
+        this client clears the cache.
+        """
+        scope_key = tuple(sorted(scope.items()))
+        # top_k only applies to similarity search
+        if search_query:
+            key = (scope_key, search_query, top_k)
+        else:
+            key = (scope_key, None, None)
+        if key in self._retrieval_cache:
+            self._retrieval_cache.move_to_end(key)
+            return self._retrieval_cache[key]
+
+        if not search_query:
+            if scope_key in self._prefetch_tasks:
+                # Shared with other waiters; cancelling this caller mustn't
+                # cancel the prefetch itself
+                return await asyncio.shield(self._prefetch_tasks[scope_key])
+            return await self._retrieve_and_cache(key, {"scope": scope})
+
+        all_key = (scope_key, None, None)
+        if all_key not in self._retrieval_cache and scope_key not in self._prefetch_tasks:
+            self._prefetch_tasks[scope_key] = asyncio.create_task(
+                self._prefetch_scope(scope_key, scope)
+            )
+
+        return await self._retrieve_and_cache(
+            key, {"scope": scope, "search_query": search_query, "top_k": top_k}
+        )
+
+    async def _prefetch_scope(self, scope_key: tuple, scope: Dict[str, str]) -> Any:
+        """Fetch and cache every memory in a scope."""
+        try:
+            return await self._retrieve_and_cache((scope_key, None, None), {"scope": scope})
+        finally:
+            if self._prefetch_tasks.get(scope_key) is asyncio.current_task():
+                del self._prefetch_tasks[scope_key]
+
+    async def _retrieve_and_cache(self, key: tuple, arguments: dict) -> Any:
+        """Call retrieve_memories and cache a successful result."""
+        generation = self._cache_generation
+        result = await self.call_tool("retrieve_memories", arguments)
+
+        # Results fetched before a write are returned but not cached
+        if (
+            generation == self._cache_generation
+            and isinstance(result, dict)
+            and result.get("status") == "success"
+        ):
+            self._retrieval_cache[key] = result
+            if len(self._retrieval_cache) > self.cache_size:
+                self._retrieval_cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop cached retrievals and forget in-flight prefetches."""
+        self._cache_generation += 1
+        self._retrieval_cache.clear()
+        self._prefetch_tasks.clear()
+
     async def initialize_memory_bank(self, memory_topics: List[str] = None):
         """Initialize the Memory Bank."""
         if not self.initialized:
@@ -94,21 +270,23 @@ async def demo_basic_operations():
     PROJECT_ID = os.environ.get("GOOGLE_CLOUD_PROJECT", "your-project-id")
     LOCATION = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
     SERVER_PATH = str(Path(__file__).parent.parent / "memory_bank_server.py")
+    # Optional: URL of a server started with --transport streamable-http
+    SERVER_URL = os.environ.get("MEMORY_BANK_SERVER_URL")
 
-    # Create and connect client
-    client = MemoryBankMCPClient(
+    # Create and connect client; the server process and session stay alive
+    # for every call made inside this block
+    async with MemoryBankMCPClient(
         server_path=SERVER_PATH,
         project_id=PROJECT_ID,
-        location=LOCATION
-    )
-
-    try:
-        await client.connect()
+        location=LOCATION,
+        server_url=SERVER_URL
+    ) as client:
+        print(f"Available tools: {[tool.name for tool in await client.list_tools()]}")
 
         # Initialize Memory Bank
         print("\nInitializing Memory Bank...")
         init_result = await client.initialize_memory_bank()
-        print(f"Result: {json.dumps(init_result, indent=2)[:200]}...")
+        print(f"Result: {preview(init_result, 200)}...")
 
         # Generate memories from a conversation
         print("\nGenerating memories from conversation...")
@@ -126,22 +304,39 @@ async def demo_basic_operations():
                 "wait_for_completion": True
             }
         )
-        print(f"Generated memories: {json.dumps(gen_result, indent=2)[:300]}...")
+        print(f"Generated memories: {preview(gen_result, 300)}...")
 
-        # Retrieve memories
+        # Retrieve memories; independent searches run concurrently
         print("\nRetrieving memories...")
-        retrieve_result = await client.call_tool(
-            "retrieve_memories",
-            {
-                "scope": {"user_id": "alice_demo_123"},
-                "search_query": "programming interests",
-                "top_k": 3
-            }
-        )
-        print(f"Retrieved: {json.dumps(retrieve_result, indent=2)[:300]}...")
+        programming_result, location_result = await client.call_tools_parallel([
+            (
+                "retrieve_memories",
+                {
+                    "scope": {"user_id": "alice_demo_123"},
+                    "search_query": "programming interests",
+                    "top_k": 3
+                }
+            ),
+            (
+                "retrieve_memories",
+                {
+                    "scope": {"user_id": "alice_demo_123"},
+                    "search_query": "where Alice works",
+                    "top_k": 3
+                }
+            ),
+        ])
+        print(f"Retrieved: {preview(programming_result, 300)}...")
+        print(f"Retrieved: {preview(location_result, 300)}...")
 
-    finally:
-        await client.disconnect()
+        # Cached retrieval: the first search for a scope also prefetches all of
+        # its memories, so the unfiltered retrieval is served from that prefetch
+        print("\nRetrieving all memories through the client cache...")
+        await client.retrieve_memories(
+            {"user_id": "alice_demo_123"}, search_query="machine learning", top_k=3
+        )
+        all_result = await client.retrieve_memories({"user_id": "alice_demo_123"})
+        print(f"All memories: {preview(all_result, 300)}...")
 
 
 if __name__ == "__main__":
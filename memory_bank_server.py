@@ -1,15 +1,12 @@
 #!/usr/bin/env python3
 """
 Memory Bank MCP Server
-"""
-
-import sys
-import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+Thin launcher for running from a checkout. When the package is installed,
+the `memory-bank-mcp` console script runs the same entry point.
+"""
 
-from src.server import run
+from src.server import main
 
 if __name__ == "__main__":
-    run()
+    main()
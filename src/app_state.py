@@ -1,6 +1,8 @@
 """Application state management"""
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import vertexai
 
 from .config import Config
 
@@ -8,16 +10,72 @@ from .config import Config
 class AppState:
     """Simple application state container following the Zen: "Simple is better than complex"."""
 
+    __slots__ = (
+        "client",
+        "agent_engine",
+        "config",
+        "initialized",
+        "_client_cache",
+        "_engine_cache",
+    )
+
     def __init__(self):
         self.client: Optional[Any] = None
         self.agent_engine: Optional[Any] = None
         self.config: Config = Config()
         self.initialized: bool = False
+        # Warm caches survive re-initialization so repeated setups are cheap
+        self._client_cache: Dict[Tuple[str, str], Any] = {}
+        self._engine_cache: Dict[Tuple[str, str, str], Any] = {}
 
     def is_ready(self) -> bool:
         """Check if the app is ready to handle memory operations."""
         return self.initialized and self.agent_engine is not None
 
+    def get_client(self, project_id: str, location: str) -> Any:
+        """
+        Return the Vertex AI client for a project and location, creating it once.
+
+        The client keeps one pooled HTTP connection and locks credential
+        refreshes, so a single instance is shared by all tool calls, including
+        those running concurrently in worker threads.
+        """
+        key = (project_id, location)
+        client = self._client_cache.get(key)
+        if client is None:
+            client = vertexai.Client(project=project_id, location=location)
+            self._client_cache[key] = client
+        return client
+
+    def get_agent_engine(
+        self, client: Any, project_id: str, location: str, agent_engine_name: str
+    ) -> Any:
+        """Return an existing Agent Engine by name, fetching it only once."""
+        key = (project_id, location, agent_engine_name)
+        agent_engine = self._engine_cache.get(key)
+        if agent_engine is None:
+            agent_engine = client.agent_engines.get(name=agent_engine_name)
+            self._engine_cache[key] = agent_engine
+        return agent_engine
+
+    def cache_agent_engine(
+        self, project_id: str, location: str, agent_engine: Any
+    ) -> None:
+        """Remember a newly created Agent Engine so later lookups by name skip `get`."""
+        key = (project_id, location, agent_engine.api_resource.name)
+        self._engine_cache[key] = agent_engine
+
+    def is_initialized_for(
+        self, project_id: str, location: str, agent_engine_name: Optional[str]
+    ) -> bool:
+        """Check if the app is already set up for this project, location and engine."""
+        return (
+            self.is_ready()
+            and agent_engine_name == self.agent_engine.api_resource.name
+            and self.config.project_id == project_id
+            and self.config.location == location
+        )
+
     def reset(self) -> None:
         """Reset the application state."""
         self.client = None
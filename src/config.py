@@ -1,37 +1,63 @@
 """Configuration module"""
 
 import os
-from typing import Optional
+from typing import Annotated, Optional
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Environment variables read by Config.from_env() and their defaults
+_ENV_DEFAULTS = {
+    "GOOGLE_CLOUD_PROJECT": "",
+    "GOOGLE_CLOUD_LOCATION": "us-central1",
+    "AGENT_ENGINE_NAME": None,
+    "GOOGLE_API_KEY": None,
+}
+
+
+def _read_env() -> dict:
+    return {key: os.environ.get(key, default) for key, default in _ENV_DEFAULTS.items()}
+
+
+# Snapshot of the relevant environment, taken once at import
+_ENV = _read_env()
+
+
+def refresh_env() -> None:
+    """Re-read the environment snapshot used by Config.from_env()."""
+    _ENV.update(_read_env())
+
 
 class Config(BaseModel):
     """Simple configuration with sensible defaults and validation."""
 
-    project_id: str = Field(default="", description="Google Cloud Project ID")
-    location: str = Field(
-        default="us-central1", description="Google Cloud location for Vertex AI"
-    )
-    agent_engine_name: Optional[str] = Field(
-        default=None, description="Existing Agent Engine resource name"
-    )
-    api_key: Optional[str] = Field(
-        default=None, description="Google API key for authentication"
-    )
+    # Immutable once built: update with model_copy(update=...) or rebuild
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    project_id: Annotated[str, Field(description="Google Cloud Project ID")] = ""
+    location: Annotated[
+        str, Field(description="Google Cloud location for Vertex AI")
+    ] = "us-central1"
+    agent_engine_name: Annotated[
+        Optional[str], Field(description="Existing Agent Engine resource name")
+    ] = None
+    api_key: Annotated[
+        Optional[str], Field(description="Google API key for authentication")
+    ] = None
 
     @classmethod
     def from_env(cls) -> "Config":
-        """Create config from environment variables."""
-        return cls(
-            project_id=os.getenv("GOOGLE_CLOUD_PROJECT", ""),
-            location=os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1"),
-            agent_engine_name=os.getenv("AGENT_ENGINE_NAME"),
-            api_key=os.getenv("GOOGLE_API_KEY"),
+        """Create config from the environment snapshot taken at import."""
+        return cls.model_validate(
+            {
+                "project_id": _ENV["GOOGLE_CLOUD_PROJECT"],
+                "location": _ENV["GOOGLE_CLOUD_LOCATION"],
+                "agent_engine_name": _ENV["AGENT_ENGINE_NAME"],
+                "api_key": _ENV["GOOGLE_API_KEY"],
+            }
         )
 
     def is_valid(self) -> bool:
@@ -1,8 +1,18 @@
 """Data formatting utilities"""
 
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from typing import Any, Dict, List
 
+from .resilience import is_transient
+
+# SDK Memory attributes; the timestamps are published as created_time and
+# updated_time
+_MEMORY_FIELDS = ("name", "fact", "scope", "create_time", "update_time")
+_get_memory_fields = attrgetter(*_MEMORY_FIELDS)
+_UTC = timezone.utc
+_EXPIRATION_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
 
 def format_memory(memory: Any) -> Dict[str, Any]:
     """
@@ -14,12 +24,22 @@ def format_memory(memory: Any) -> Dict[str, Any]:
     Returns:
         Formatted memory dictionary
     """
+    try:
+        name, fact, scope, created_time, updated_time = _get_memory_fields(memory)
+    except AttributeError:
+        # Partial objects (e.g. a pending operation) lack some fields
+        name, fact, scope, created_time, updated_time = (
+            getattr(memory, field, None) for field in _MEMORY_FIELDS
+        )
+
+    # Timestamps stay datetimes; FastMCP's pydantic-core JSON encoder writes
+    # them as RFC 3339 strings without a str() round trip here
     return {
-        "name": getattr(memory, "name", None),
-        "fact": getattr(memory, "fact", None),
-        "scope": getattr(memory, "scope", None),
-        "created_time": str(getattr(memory, "created_time", None)),
-        "updated_time": str(getattr(memory, "updated_time", None)),
+        "name": name,
+        "fact": fact,
+        "scope": scope,
+        "created_time": created_time,
+        "updated_time": updated_time,
     }
 
 
@@ -33,12 +53,10 @@ def format_conversation_events(conversation: List[Dict[str, str]]) -> List[Dict]
     Returns:
         List of events in Vertex AI format
     """
-    events = []
-    for turn in conversation:
-        events.append(
-            {"content": {"role": turn["role"], "parts": [{"text": turn["content"]}]}}
-        )
-    return events
+    return [
+        {"content": {"role": turn["role"], "parts": [{"text": turn["content"]}]}}
+        for turn in conversation
+    ]
 
 
 def format_ttl_expiration(ttl_seconds: int) -> str:
@@ -49,10 +67,10 @@ def format_ttl_expiration(ttl_seconds: int) -> str:
         ttl_seconds: Time to live in seconds
 
     Returns:
-        ISO format expiration string
+        ISO format expiration string (UTC, second precision)
     """
-    expiration = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
-    return expiration.isoformat().replace("+00:00", "Z")
+    expiration = datetime.now(_UTC) + timedelta(seconds=ttl_seconds)
+    return expiration.strftime(_EXPIRATION_FORMAT)
 
 
 def format_error_response(error: str, details: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -66,10 +84,29 @@ def format_error_response(error: str, details: Dict[str, Any] = None) -> Dict[st
     Returns:
         Formatted error response
     """
-    response = {"status": "error", "error": error}
     if details:
-        response["details"] = details
-    return response
+        return {"status": "error", "error": error, "details": details}
+    return {"status": "error", "error": error}
+
+
+def format_api_error_response(error: Any) -> Dict[str, Any]:
+    """
+    Format a Vertex AI API error from its structured fields.
+
+    Args:
+        error: google.genai APIError
+
+    Returns:
+        Formatted error response with the HTTP code and API status
+    """
+    return format_error_response(
+        error.message or f"{error.code} {error.status}",
+        {
+            "code": error.code,
+            "status": error.status,
+            "retryable": is_transient(error),
+        },
+    )
 
 
 def format_success_response(
@@ -85,9 +122,11 @@ def format_success_response(
     Returns:
         Formatted success response
     """
-    response = {"status": "success"}
-    if message:
-        response["message"] = message
+    # One dict literal per shape; data-only is the common case
     if data:
-        response.update(data)
-    return response
+        if message:
+            return {"status": "success", "message": message, **data}
+        return {"status": "success", **data}
+    if message:
+        return {"status": "success", "message": message}
+    return {"status": "success"}
@@ -1,23 +1,10 @@
 """MCP Prompts - Pre-built prompts for common memory patterns."""
 
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.prompts import Prompt
 
-
-def register_prompts(mcp: FastMCP):
-    """Register all MCP prompts with the server."""
-    
-    @mcp.prompt()
-    async def memory_extraction_prompt(conversation: str) -> str:
-        """
-        Prompt for extracting memories from a conversation.
-        
-        Args:
-            conversation: The conversation text to analyze
-        
-        Returns:
-            A prompt for memory extraction
-        """
-        return f"""Analyze this conversation and extract key information to remember:
+# Prompt templates, defined once; each call is a single format()
+_MEMORY_EXTRACTION_TEMPLATE = """Analyze this conversation and extract key information to remember:
 
 {conversation}
 
@@ -29,19 +16,8 @@ Extract the following types of information:
 
 Format each memory as a clear, standalone fact that can be understood without context.
 Be specific and include relevant details."""
-    
-    @mcp.prompt()
-    async def memory_search_prompt(user_query: str) -> str:
-        """
-        Convert a user question into an optimized memory search query.
-        
-        Args:
-            user_query: The user's question
-        
-        Returns:
-            Optimized search query
-        """
-        return f"""Convert this question into keywords for searching memories:
+
+_MEMORY_SEARCH_TEMPLATE = """Convert this question into keywords for searching memories:
 
 Question: {user_query}
 
@@ -53,20 +29,8 @@ Focus on:
 - Action words if relevant
 
 Return a concise search query optimized for similarity matching."""
-    
-    @mcp.prompt()
-    async def memory_consolidation_prompt(existing_memories: str, new_fact: str) -> str:
-        """
-        Prompt for consolidating or merging related memories.
-        
-        Args:
-            existing_memories: Current memories as text
-            new_fact: New fact to potentially consolidate
-        
-        Returns:
-            Prompt for memory consolidation
-        """
-        return f"""Review these existing memories and determine how to handle a new fact:
+
+_MEMORY_CONSOLIDATION_TEMPLATE = """Review these existing memories and determine how to handle a new fact:
 
 Existing memories:
 {existing_memories}
@@ -80,4 +44,65 @@ Determine if the new fact:
 3. Contradicts an existing memory (specify which one should be kept)
 4. Is redundant and should not be stored
 
-Provide your recommendation with clear reasoning."""
\ No newline at end of file
+Provide your recommendation with clear reasoning."""
+
+
+async def memory_extraction_prompt(conversation: str) -> str:
+    """
+    Prompt for extracting memories from a conversation.
+    
+    Args:
+        conversation: The conversation text to analyze
+    
+    Returns:
+        A prompt for memory extraction
+    """
+    return _MEMORY_EXTRACTION_TEMPLATE.format(conversation=conversation)
+
+
+async def memory_search_prompt(user_query: str) -> str:
+    """
+    Convert a user question into an optimized memory search query.
+    
+    Args:
+        user_query: The user's question
+    
+    Returns:
+        Optimized search query
+    """
+    return _MEMORY_SEARCH_TEMPLATE.format(user_query=user_query)
+
+
+async def memory_consolidation_prompt(existing_memories: str, new_fact: str) -> str:
+    """
+    Prompt for consolidating or merging related memories.
+    
+    Args:
+        existing_memories: Current memories as text
+        new_fact: New fact to potentially consolidate
+    
+    Returns:
+        Prompt for memory consolidation
+    """
+    return _MEMORY_CONSOLIDATION_TEMPLATE.format(
+        existing_memories=existing_memories, new_fact=new_fact
+    )
+
+
+# Prompt definitions are built once at import; FastMCP derives each prompt's
+# argument schema from the function signature, so servers created later only
+# need to register the prebuilt objects.
+_PROMPTS = [
+    Prompt.from_function(prompt)
+    for prompt in (
+        memory_extraction_prompt,
+        memory_search_prompt,
+        memory_consolidation_prompt,
+    )
+]
+
+
+def register_prompts(mcp: FastMCP):
+    """Register all MCP prompts with the server."""
+    for prompt in _PROMPTS:
+        mcp.add_prompt(prompt)
@@ -0,0 +1,114 @@
+"""Circuit breaker and retry helpers for Vertex AI calls"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Callable, Optional
+
+from google.genai import errors as genai_errors
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker.
+
+    After `fail_max` consecutive transient failures the circuit opens and calls
+    are rejected immediately for `reset_timeout` seconds. The next call after
+    that is let through; success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def is_open(self) -> bool:
+        """Check if calls are currently being rejected."""
+        if self._opened_at is None:
+            return False
+        return time.monotonic() - self._opened_at < self.reset_timeout
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit once the limit is reached."""
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+            logger.warning(
+                "Circuit opened after %s failures; retrying in %ss",
+                self._failures,
+                self.reset_timeout,
+            )
+
+
+def is_transient(error: Exception) -> bool:
+    """Check if an error is worth retrying (throttling, server or network errors)."""
+    if isinstance(error, genai_errors.APIError):
+        return error.code == 429 or error.code >= 500
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+# Shared by every Vertex AI client/Agent Engine lookup in the process
+vertex_breaker = CircuitBreaker()
+
+
+async def call_with_retry(
+    func: Callable[..., Any],
+    *args: Any,
+    attempts: int = 4,
+    initial_delay: float = 0.1,
+    max_delay: float = 5.0,
+    breaker: CircuitBreaker = vertex_breaker,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call a blocking `func` in a worker thread, with exponential backoff and
+    jitter on transient errors.
+
+    Args:
+        func: Blocking callable to invoke with `args` and `kwargs`
+        attempts: Maximum number of attempts
+        initial_delay: Delay before the first retry, in seconds
+        max_delay: Upper bound for a single delay, in seconds
+        breaker: Circuit breaker guarding the call
+
+    Returns:
+        The result of `func`
+
+    Raises:
+        CircuitOpenError: If the circuit is open
+        Exception: The last error raised by `func`
+    """
+    for attempt in range(attempts):
+        if breaker.is_open():
+            raise CircuitOpenError(
+                "Vertex AI is unavailable after repeated failures; try again later"
+            )
+
+        try:
+            result = await asyncio.to_thread(func, *args, **kwargs)
+        except Exception as e:
+            if not is_transient(e):
+                raise
+            breaker.record_failure()
+            if attempt == attempts - 1:
+                raise
+            delay = min(max_delay, initial_delay * 2**attempt)
+            delay = random.uniform(0, delay)
+            logger.warning("Transient error (%s); retrying in %.2fs", e, delay)
+            await asyncio.sleep(delay)
+        else:
+            breaker.record_success()
+            return result
@@ -1,35 +1,49 @@
 """Main server module - Orchestrates the MCP server."""
 
+import argparse
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
-import vertexai
 from mcp.server.fastmcp import FastMCP
 
 from .app_state import app
 from .config import Config
 from .prompts import register_prompts
+from .resilience import call_with_retry
 from .tools import register_tools
 
-# Configure logging to stderr (MCP uses stdout for protocol)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
-)
+# Configure logging to stderr (MCP uses stdout for protocol). Log calls pass
+# their arguments lazily and the format skips timestamps, so records below
+# the configured level cost no string formatting or time.strftime call.
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s %(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent blocking Vertex AI SDK calls
+MAX_WORKER_THREADS = 16
 
-@asynccontextmanager
-async def lifespan(server: FastMCP):
-    """
-    Manage application lifecycle.
-    
-    Simple startup and shutdown logic following "Simple is better than complex".
-    """
-    # Startup
+# Blocking Vertex AI SDK calls run in this pool via asyncio.to_thread, keeping
+# the event loop free for other requests. One pool serves the whole process.
+_executor = ThreadPoolExecutor(
+    max_workers=MAX_WORKER_THREADS, thread_name_prefix="vertex-sdk"
+)
+
+
+# FastMCP enters the lifespan once per client session over streamable HTTP,
+# so process-wide startup is guarded to run only for the first one
+_startup_lock = asyncio.Lock()
+_started = False
+
+
+async def _startup() -> None:
+    """Load configuration and connect to Vertex AI, once per process."""
     logger.info("Starting Memory Bank MCP Server")
+
+    asyncio.get_running_loop().set_default_executor(_executor)
     
     # Load configuration from environment
     app.config = Config.from_env()
@@ -37,35 +51,70 @@ async def lifespan(server: FastMCP):
     # Try to initialize Vertex AI client if configured
     if app.config.is_valid():
         try:
-            app.client = vertexai.Client(
-                project=app.config.project_id,
-                location=app.config.location,
+            app.client = await call_with_retry(
+                app.get_client, app.config.project_id, app.config.location
             )
             app.initialized = True
             logger.info("Vertex AI client initialized from environment")
+
+            # Resolving a configured engine now makes the tools usable right
+            # away and opens the client's connection (TLS + token) before the
+            # first request needs it
+            if app.config.agent_engine_name:
+                app.agent_engine = await call_with_retry(
+                    app.get_agent_engine,
+                    app.client,
+                    app.config.project_id,
+                    app.config.location,
+                    app.config.agent_engine_name,
+                )
+                logger.info(
+                    "Using Agent Engine from environment: %s",
+                    app.agent_engine.api_resource.name,
+                )
         except Exception as e:
-            logger.warning(f"Could not initialize Vertex AI client: {e}")
+            logger.warning("Could not initialize Vertex AI client: %s", e)
             logger.info("Server running - use initialize_memory_bank to set up")
     else:
         logger.info("No configuration found - use initialize_memory_bank to get started")
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """
+    Manage application lifecycle.
     
-    yield app
+    Simple startup and shutdown logic following "Simple is better than complex".
+    Later sessions share the state set up by the first one and leave it alone.
+    """
+    global _started
+    # Sessions arriving mid-startup wait for it, so nothing they set up is
+    # overwritten by startup finishing later
+    async with _startup_lock:
+        if not _started:
+            await _startup()
+            _started = True
     
-    # Shutdown
-    logger.info("Shutting down Memory Bank MCP Server")
+    yield app
 
 
-def create_server() -> FastMCP:
+def create_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
     """
     Create and configure the MCP server.
     
+    Args:
+        host: Bind address for the HTTP transport
+        port: Port for the HTTP transport
+    
     Returns:
         Configured FastMCP server instance
     """
     # Create the server
     mcp = FastMCP(
         "Vertex AI Memory Bank",
-        lifespan=lifespan
+        lifespan=lifespan,
+        host=host,
+        port=port,
     )
     
     # Register all tools and prompts
@@ -77,13 +126,40 @@ def create_server() -> FastMCP:
     return mcp
 
 
-def run():
-    """Run the Memory Bank MCP server."""
+def run(transport: str = "stdio", host: str = "127.0.0.1", port: int = 8000):
+    """
+    Run the Memory Bank MCP server.
+    
+    Args:
+        transport: "stdio" (default) or "streamable-http" for a long-running
+                   server that many clients can share
+        host: Bind address for the HTTP transport
+        port: Port for the HTTP transport
+    """
     try:
-        server = create_server()
-        server.run()
+        server = create_server(host, port)
+        server.run(transport=transport)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
-        sys.exit(1)
\ No newline at end of file
+        logger.error("Server error: %s", e)
+        sys.exit(1)
+    finally:
+        logger.info("Shutting down Memory Bank MCP Server")
+        _executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Vertex AI Memory Bank MCP server")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "streamable-http"],
+        default="stdio",
+        help="MCP transport (default: stdio)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP port")
+    args = parser.parse_args()
+
+    run(transport=args.transport, host=args.host, port=args.port)
@@ -1,24 +1,153 @@
 """MCP Tools"""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
-import vertexai
+from google.genai import errors as genai_errors
 from mcp.server.fastmcp import FastMCP
+from typing_extensions import NotRequired, TypedDict
 
 from .app_state import app
 from .formatters import (
+    format_api_error_response,
     format_conversation_events,
     format_error_response,
     format_memory,
     format_success_response,
     format_ttl_expiration,
 )
+from .resilience import call_with_retry
 from .validators import validate_conversation, validate_memory_fact, validate_scope
 
 logger = logging.getLogger(__name__)
 
 
+# Tools are annotated with the builtin dict so FastMCP publishes the response
+# itself as structured content (typing.Dict gets wrapped as {"result": ...})
+ToolResponse = dict[str, Any]
+
+_get_memory = attrgetter("memory")
+
+
+class MemoryInput(TypedDict):
+    """A memory to create in a batch."""
+
+    fact: str
+    scope: Dict[str, str]
+    ttl_seconds: NotRequired[Optional[int]]
+
+
+def _next_page(pager: Any) -> Optional[List[Any]]:
+    """Fetch the pager's next page (blocking), or None when it is exhausted."""
+    if not pager.config.get("page_token"):
+        return None
+    return list(pager.next_page())
+
+
+async def _iter_pages(
+    list_method: Callable[..., Any], /, **kwargs: Any
+) -> AsyncIterator[List[Any]]:
+    """
+    Call a paged SDK method and yield its results one page at a time.
+
+    Page tokens are sequential, so pages can't be requested in parallel.
+    Instead the next page is fetched in a worker thread while the caller
+    processes the current one.
+    """
+    pager = await asyncio.to_thread(list_method, **kwargs)
+    if not hasattr(pager, "next_page"):
+        # Not a pager; drain it in one go
+        yield await asyncio.to_thread(list, pager)
+        return
+
+    page: Optional[List[Any]] = list(pager.page)
+    pending = None
+    try:
+        while page is not None:
+            pending = asyncio.create_task(asyncio.to_thread(_next_page, pager))
+            yield page
+            page = await pending
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+def _create_memory(
+    fact: str, scope: Dict[str, str], ttl_seconds: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Create a single memory in the initialized Agent Engine (blocking).
+
+    Args:
+        fact: The information to remember
+        scope: User identifier
+        ttl_seconds: Optional time-to-live in seconds
+
+    Returns:
+        Formatted memory
+    """
+    # Add expiration if TTL provided
+    expire_time = (
+        format_ttl_expiration(ttl_seconds) if ttl_seconds and ttl_seconds > 0 else None
+    )
+
+    # Create memory with correct API
+    operation = app.client.agent_engines.create_memory(
+        name=app.agent_engine.api_resource.name,
+        fact=fact.strip(),
+        scope=scope,
+        config={"expire_time": expire_time} if expire_time else None,
+    )
+
+    # Extract the actual memory from the operation response
+    if operation.response:
+        memory = operation.response
+    else:
+        # If not done yet, return operation info
+        memory = operation
+
+    return format_memory(memory)
+
+
+# Name of the generated memories field on generate_memories responses; it
+# depends on the SDK build, not the call, so it's resolved once per process
+_generated_memories_attr: Optional[str] = None
+
+
+def _generated_memories(response: Any) -> Optional[List[Any]]:
+    """Get the generated memories from a generate_memories response."""
+    global _generated_memories_attr
+    if _generated_memories_attr is not None:
+        return getattr(response, _generated_memories_attr, None)
+
+    # Only remember a name actually seen; e.g. a failed operation's response
+    # is None and says nothing about the layout
+    for attr in ("generatedMemories", "generated_memories"):
+        if hasattr(response, attr):
+            _generated_memories_attr = attr
+            return getattr(response, attr)
+    return None
+
+
+def _summarize_generated_memories(generated: List[Any]) -> List[Dict[str, Any]]:
+    """Reduce generated memories to their action and fact."""
+    # Every item in a response has the same layout, so probe only the first
+    if hasattr(generated[0], "memory"):
+        return [
+            {
+                "action": getattr(mem, "action", None),
+                "fact": getattr(getattr(mem, "memory", None), "fact", None),
+            }
+            for mem in generated
+        ]
+    return [
+        {"action": getattr(mem, "action", None), "fact": getattr(mem, "fact", None)}
+        for mem in generated
+    ]
+
+
 def register_tools(mcp: FastMCP):
     """Register all MCP tools with the server."""
 
@@ -32,7 +161,7 @@ def register_tools(mcp: FastMCP):
         location: str = "us-central1",
         memory_topics: Optional[List[str]] = None,
         agent_engine_name: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> ToolResponse:
         """
         Initialize Memory Bank with your Google Cloud project.
 
@@ -58,11 +187,22 @@ def register_tools(mcp: FastMCP):
                 memory_topics=["USER_PREFERENCES", "USER_PERSONAL_INFO"]
             )
         """
+        # Reconnecting clients often repeat the same call; answer it from state
+        if app.is_initialized_for(project_id, location, agent_engine_name):
+            logger.info("Memory Bank already initialized with %s", agent_engine_name)
+            return format_success_response(
+                {
+                    "agent_engine_name": agent_engine_name,
+                    "project_id": project_id,
+                    "location": location,
+                }
+            )
+
         try:
-            logger.info(f"Initializing Memory Bank for project {project_id}")
+            logger.info("Initializing Memory Bank for project %s", project_id)
 
-            # Create Vertex AI client
-            client = vertexai.Client(project=project_id, location=location)
+            # Reuse the Vertex AI client for this project/location if we have one
+            client = await call_with_retry(app.get_client, project_id, location)
 
             # Build configuration if topics provided
             config = {}
@@ -79,28 +219,37 @@ def register_tools(mcp: FastMCP):
             # Use existing or create new Agent Engine
             if agent_engine_name:
                 # Reuse specified engine
-                agent_engine = client.agent_engines.get(name=agent_engine_name)
+                agent_engine = await call_with_retry(
+                    app.get_agent_engine,
+                    client,
+                    project_id,
+                    location,
+                    agent_engine_name,
+                )
                 logger.info(
-                    f"Using specified Agent Engine: {agent_engine.api_resource.name}"
+                    "Using specified Agent Engine: %s", agent_engine.api_resource.name
                 )
             else:
                 # Always create a new Agent Engine with Memory Bank
-                agent_engine = client.agent_engines.create(
+                agent_engine = await asyncio.to_thread(
+                    client.agent_engines.create,
                     config=(
                         {"context_spec": {"memory_bank_config": config}}
                         if config
                         else None
                     )
                 )
+                app.cache_agent_engine(project_id, location, agent_engine)
                 logger.info(
-                    f"Created new Agent Engine: {agent_engine.api_resource.name}"
+                    "Created new Agent Engine: %s", agent_engine.api_resource.name
                 )
 
             # Update app state
             app.client = client
             app.agent_engine = agent_engine
-            app.config.project_id = project_id
-            app.config.location = location
+            app.config = app.config.model_copy(
+                update={"project_id": project_id, "location": location}
+            )
             app.initialized = True
 
             return format_success_response(
@@ -111,8 +260,11 @@ def register_tools(mcp: FastMCP):
                 }
             )
 
+        except genai_errors.APIError as e:
+            logger.error("Failed to initialize: %s %s", e.code, e.message)
+            return format_api_error_response(e)
         except Exception as e:
-            logger.error(f"Failed to initialize: {e}")
+            logger.error("Failed to initialize: %s", e)
             return format_error_response(str(e))
 
     # ========================================================================
@@ -124,7 +276,7 @@ def register_tools(mcp: FastMCP):
         conversation: List[Dict[str, str]],
         scope: Dict[str, str],
         wait_for_completion: bool = True,
-    ) -> Dict[str, Any]:
+    ) -> ToolResponse:
         """
         Generate memories from a conversation.
 
@@ -162,14 +314,15 @@ def register_tools(mcp: FastMCP):
             events = format_conversation_events(conversation)
 
             # Generate memories
-            operation = app.client.agent_engines.generate_memories(
+            operation = await asyncio.to_thread(
+                app.client.agent_engines.generate_memories,
                 name=app.agent_engine.api_resource.name,
                 direct_contents_source={"events": events},
                 scope=scope,
                 config={"wait_for_completion": wait_for_completion},
             )
 
-            logger.info(f"Generated memories for scope {scope}")
+            logger.info("Generated memories for scope %s", scope)
 
             # Format response
             result = {
@@ -180,30 +333,19 @@ def register_tools(mcp: FastMCP):
 
             # Include generated memories if operation completed
             if operation.done and hasattr(operation, "response"):
-                # Try different possible attribute names for API compatibility
-                generated_mems = None
-                if hasattr(operation.response, "generatedMemories"):
-                    generated_mems = operation.response.generatedMemories
-                elif hasattr(operation.response, "generated_memories"):
-                    generated_mems = operation.response.generated_memories
-
+                generated_mems = _generated_memories(operation.response)
                 if generated_mems:
-                    result["generated_memories"] = [
-                        {
-                            "action": getattr(mem, "action", None),
-                            "fact": (
-                                getattr(getattr(mem, "memory", None), "fact", None)
-                                if hasattr(mem, "memory")
-                                else getattr(mem, "fact", None)
-                            ),
-                        }
-                        for mem in generated_mems
-                    ]
+                    result["generated_memories"] = _summarize_generated_memories(
+                        generated_mems
+                    )
 
             return format_success_response(result)
 
+        except genai_errors.APIError as e:
+            logger.error("Failed to generate memories: %s %s", e.code, e.message)
+            return format_api_error_response(e)
         except Exception as e:
-            logger.error(f"Failed to generate memories: {e}")
+            logger.error("Failed to generate memories: %s", e)
             return format_error_response(str(e))
 
     # ========================================================================
@@ -213,7 +355,7 @@ def register_tools(mcp: FastMCP):
     @mcp.tool()
     async def retrieve_memories(
         scope: Dict[str, str], search_query: Optional[str] = None, top_k: int = 5
-    ) -> Dict[str, Any]:
+    ) -> ToolResponse:
         """
         Retrieve memories for a user, with optional similarity search.
 
@@ -249,7 +391,8 @@ def register_tools(mcp: FastMCP):
             # Retrieve memories
             if search_query:
                 # Similarity search
-                results = app.client.agent_engines.retrieve_memories(
+                pages = _iter_pages(
+                    app.client.agent_engines.retrieve_memories,
                     name=app.agent_engine.api_resource.name,
                     scope=scope,
                     similarity_search_params={
@@ -257,28 +400,43 @@ def register_tools(mcp: FastMCP):
                         "top_k": top_k,
                     },
                 )
-                logger.info(f"Searched memories for {scope} with query: {search_query}")
             else:
                 # Get all memories for scope
-                results = app.client.agent_engines.retrieve_memories(
-                    name=app.agent_engine.api_resource.name, scope=scope
+                pages = _iter_pages(
+                    app.client.agent_engines.retrieve_memories,
+                    name=app.agent_engine.api_resource.name,
+                    scope=scope,
                 )
-                logger.info(f"Retrieved all memories for {scope}")
 
-            # Format memories
+            # Format each page while the next one is being fetched
+            fmt = format_memory
             memories = []
-            for retrieved in list(results):
-                memory_data = format_memory(retrieved.memory)
-                if search_query and hasattr(retrieved, "distance"):
-                    memory_data["similarity_score"] = retrieved.distance
-                memories.append(memory_data)
+            async for page in pages:
+                # Every result on a page has the same shape; check it once
+                if search_query and page and hasattr(page[0], "distance"):
+                    for retrieved in page:
+                        memory_data = fmt(retrieved.memory)
+                        memory_data["similarity_score"] = retrieved.distance
+                        memories.append(memory_data)
+                else:
+                    memories.extend(map(fmt, map(_get_memory, page)))
+
+            if search_query:
+                logger.info(
+                    "Searched memories for %s with query: %s", scope, search_query
+                )
+            else:
+                logger.info("Retrieved all memories for %s", scope)
 
             return format_success_response(
                 {"scope": scope, "memories_count": len(memories), "memories": memories}
             )
 
+        except genai_errors.APIError as e:
+            logger.error("Failed to retrieve memories: %s %s", e.code, e.message)
+            return format_api_error_response(e)
         except Exception as e:
-            logger.error(f"Failed to retrieve memories: {e}")
+            logger.error("Failed to retrieve memories: %s", e)
             return format_error_response(str(e))
 
     # ========================================================================
@@ -288,7 +446,7 @@ def register_tools(mcp: FastMCP):
     @mcp.tool()
     async def create_memory(
         fact: str, scope: Dict[str, str], ttl_seconds: Optional[int] = None
-    ) -> Dict[str, Any]:
+    ) -> ToolResponse:
         """
         Create a memory directly.
 
@@ -320,42 +478,100 @@ def register_tools(mcp: FastMCP):
             return format_error_response(error)
 
         try:
-            # Build memory data
-            memory_data = {"fact": fact.strip(), "scope": scope}
+            memory = await asyncio.to_thread(_create_memory, fact, scope, ttl_seconds)
+            logger.info("Created memory for %s", scope)
 
-            # Add expiration if TTL provided
-            if ttl_seconds and ttl_seconds > 0:
-                memory_data["expire_time"] = format_ttl_expiration(ttl_seconds)
+            return format_success_response({"memory": memory})
 
-            # Create memory with correct API
-            operation = app.client.agent_engines.create_memory(
-                name=app.agent_engine.api_resource.name,
-                fact=fact,
-                scope=scope,
-                config=(
-                    {"expire_time": memory_data.get("expire_time")}
-                    if "expire_time" in memory_data
-                    else None
-                ),
+        except genai_errors.APIError as e:
+            logger.error("Failed to create memory: %s %s", e.code, e.message)
+            return format_api_error_response(e)
+        except Exception as e:
+            logger.error("Failed to create memory: %s", e)
+            return format_error_response(str(e))
+
+    @mcp.tool()
+    async def create_memories_batch(memories: List[MemoryInput]) -> ToolResponse:
+        """
+        Create several memories in one call.
+
+        The memories are created concurrently, so storing N facts costs
+        roughly one round trip instead of N.
+
+        Args:
+            memories: List of memories, each with 'fact', 'scope' and an
+                      optional 'ttl_seconds'
+
+        Returns:
+            Created memories and any per-memory errors, or an error if no
+            memory could be created
+
+        Example:
+            await create_memories_batch([
+                {"fact": "Alice prefers dark mode", "scope": {"user_id": "alice123"}},
+                {"fact": "Alice loves Python", "scope": {"user_id": "alice123"}},
+            ])
+        """
+        if not app.is_ready():
+            return format_error_response(
+                "Memory Bank not initialized. Call initialize_memory_bank first."
             )
 
-            # Extract the actual memory from the operation response
-            if operation.response:
-                memory = operation.response
+        # Validate every memory before creating any of them
+        if not isinstance(memories, list) or not memories:
+            return format_error_response("Memories must be a non-empty list")
+
+        for i, memory in enumerate(memories):
+            if not isinstance(memory, dict):
+                return format_error_response(f"Memory {i} must be a dictionary")
+
+            if error := validate_memory_fact(memory.get("fact")):
+                return format_error_response(f"Memory {i}: {error}")
+
+            if error := validate_scope(memory.get("scope")):
+                return format_error_response(f"Memory {i}: {error}")
+
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    _create_memory,
+                    memory["fact"],
+                    memory["scope"],
+                    memory.get("ttl_seconds"),
+                )
+                for memory in memories
+            ),
+            return_exceptions=True,
+        )
+
+        created = []
+        errors = []
+        for i, result in enumerate(results):
+            if isinstance(result, genai_errors.APIError):
+                logger.error(
+                    "Failed to create memory %s: %s %s", i, result.code, result.message
+                )
+                errors.append({"index": i, **format_api_error_response(result)})
+            elif isinstance(result, Exception):
+                logger.error("Failed to create memory %s: %s", i, result)
+                errors.append({"index": i, **format_error_response(str(result))})
             else:
-                # If not done yet, return operation info
-                memory = operation
+                created.append(result)
 
-            logger.info(f"Created memory for {scope}")
+        logger.info("Created %s of %s memories", len(created), len(memories))
 
-            return format_success_response({"memory": format_memory(memory)})
+        if not created:
+            return format_error_response(
+                "Failed to create any memories", {"errors": errors}
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to create memory: {e}")
-            return format_error_response(str(e))
+        response = {"created_count": len(created), "memories": created}
+        if errors:
+            response["errors"] = errors
+        return format_success_response(response)
 
     @mcp.tool()
-    async def delete_memory(memory_name: str) -> Dict[str, Any]:
+    async def delete_memory(memory_name: str) -> ToolResponse:
         """
         Delete a specific memory by name.
 
@@ -371,16 +587,21 @@ def register_tools(mcp: FastMCP):
             )
 
         try:
-            app.client.agent_engines.delete_memory(name=memory_name)
-            logger.info(f"Deleted memory: {memory_name}")
+            await asyncio.to_thread(
+                app.client.agent_engines.delete_memory, name=memory_name
+            )
+            logger.info("Deleted memory: %s", memory_name)
 
             return format_success_response({"deleted": memory_name})
+        except genai_errors.APIError as e:
+            logger.error("Failed to delete memory: %s %s", e.code, e.message)
+            return format_api_error_response(e)
         except Exception as e:
-            logger.error(f"Failed to delete memory: {e}")
+            logger.error("Failed to delete memory: %s", e)
             return format_error_response(str(e))
 
     @mcp.tool()
-    async def list_memories(page_size: int = 50) -> Dict[str, Any]:
+    async def list_memories(page_size: int = 50) -> ToolResponse:
         """
         List all memories in the Memory Bank.
 
@@ -396,25 +617,34 @@ def register_tools(mcp: FastMCP):
             )
 
         try:
-            pager = app.client.agent_engines.list_memories(
+            pages = _iter_pages(
+                app.client.agent_engines.list_memories,
                 name=app.agent_engine.api_resource.name,
                 config={"page_size": page_size} if page_size else None,
             )
 
-            # Convert iterator to list and format
+            # Format each page while the next one is being fetched
+            debug = logger.isEnabledFor(logging.DEBUG)
             memories = []
-            for memory in pager:
-                logger.debug(f"Processing memory: {memory}")
-                formatted = format_memory(memory)
-                logger.debug(f"Formatted memory: {formatted}")
-                memories.append(formatted)
-
-            logger.info(f"Listed {len(memories)} memories")
+            async for page in pages:
+                if not debug:
+                    memories.extend(map(format_memory, page))
+                    continue
+                for memory in page:
+                    logger.debug("Processing memory: %s", memory)
+                    formatted = format_memory(memory)
+                    logger.debug("Formatted memory: %s", formatted)
+                    memories.append(formatted)
+
+            logger.info("Listed %s memories", len(memories))
 
             return format_success_response(
                 {"count": len(memories), "memories": memories}
             )
 
+        except genai_errors.APIError as e:
+            logger.error("Failed to list memories: %s %s", e.code, e.message)
+            return format_api_error_response(e)
         except Exception as e:
-            logger.error(f"Failed to list memories: {e}")
+            logger.error("Failed to list memories: %s", e)
             return format_error_response(str(e))
@@ -2,6 +2,9 @@
 
 from typing import Dict, List, Optional
 
+_VALID_ROLES = frozenset({"user", "assistant", "system"})
+_MISSING = object()
+
 
 def validate_scope(scope: Dict[str, str]) -> Optional[str]:
     """
@@ -19,6 +22,13 @@ def validate_scope(scope: Dict[str, str]) -> Optional[str]:
     if not scope:
         return "Scope cannot be empty"
     
+    # Fast path: plain str keys and values; subclasses fall through below
+    for key, value in scope.items():
+        if type(key) is not str or type(value) is not str:
+            break
+    else:
+        return None
+    
     for key, value in scope.items():
         if not isinstance(key, str) or not isinstance(value, str):
             return f"Scope keys and values must be strings: {key}={value}"
@@ -42,8 +52,17 @@ def validate_conversation(conversation: List[Dict[str, str]]) -> Optional[str]:
     if not conversation:
         return "Conversation cannot be empty"
     
-    valid_roles = {"user", "assistant", "system"}
+    # Fast path: a single lookup per turn, no error formatting
+    valid_roles = _VALID_ROLES
+    for turn in conversation:
+        if type(turn) is not dict:
+            break
+        if turn.get("role", _MISSING) not in valid_roles or "content" not in turn:
+            break
+    else:
+        return None
     
+    # Something is wrong; walk again to report the first offending turn
     for i, turn in enumerate(conversation):
         if not isinstance(turn, dict):
             return f"Turn {i} must be a dictionary"